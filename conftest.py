@@ -0,0 +1 @@
+"""Permite que os testes importem o pacote `nucleo` a partir da raiz do repositório"""
@@ -0,0 +1,5 @@
+"""Núcleo do bot de dicionário: configuração, armazenamento e comandos"""
+from .config import Configuracao, carregar_configuracao
+from .armazenamento import Armazenamento, criar_armazenamento
+
+__all__ = ['Configuracao', 'carregar_configuracao', 'Armazenamento', 'criar_armazenamento']
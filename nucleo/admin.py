@@ -0,0 +1,54 @@
+"""Comandos de manutenção do dono do bot"""
+import logging
+
+import discord
+from discord.ext import commands
+
+logger = logging.getLogger(__name__)
+
+
+class Administracao(commands.Cog):
+    """Recarga de comandos e dados sem reiniciar o bot"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_check(self, ctx):
+        return await self.bot.is_owner(ctx.author)
+
+    @commands.command()
+    async def recarregar(self, ctx, alvo: str = 'tudo'):
+        """Recarrega os comandos e/ou os dados sem reconectar ao Discord"""
+        if alvo not in ('tudo', 'comandos', 'dados'):
+            await ctx.send("❌ **Alvo inválido!** Use `comandos`, `dados` ou `tudo`.")
+            return
+
+        resultados = []
+
+        if alvo in ('tudo', 'comandos'):
+            for extensao in self.bot.extensoes:
+                try:
+                    await self.bot.reload_extension(extensao)
+                    resultados.append(f"✅ `{extensao}`")
+                except commands.ExtensionError as e:
+                    logger.error(f"Erro ao recarregar {extensao}: {e}")
+                    resultados.append(f"❌ `{extensao}`: {e}")
+
+        if alvo in ('tudo', 'dados'):
+            armazenamento = self.bot.armazenamento
+            if await armazenamento.recarregar():
+                resultados.append(f"✅ Dados: {len(armazenamento)} termos ({armazenamento.nome})")
+            else:
+                resultados.append("❌ Dados: não foi possível reler o dicionário (veja os logs)")
+
+        embed = discord.Embed(
+            title="🔄 **Recarga Concluída**",
+            description="\n".join(resultados),
+            color=0x00ff00
+        )
+        await ctx.send(embed=embed)
+
+
+async def setup(bot):
+    """Carrega os comandos de manutenção como extensão"""
+    await bot.add_cog(Administracao(bot))
@@ -0,0 +1,273 @@
+"""Backends de armazenamento do dicionário"""
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+
+from .chaves import IndiceDobrado, canonizar
+from .migracao import migrar_arquivo
+from .tarefas import serializar_dicionario
+
+logger = logging.getLogger(__name__)
+
+
+class Armazenamento:
+    """Interface comum dos backends de armazenamento
+
+    Os termos ficam sempre em memória (chave canônica -> entrada, ver
+    `chaves` e `esquema`); cada backend define apenas como carregar
+    (`abrir`), gravar (`persistir`) e liberar recursos (`fechar`), e usa
+    `_trocar` para instalar os termos carregados. A serialização roda no
+    `pool`.
+    """
+
+    nome = 'Base'
+
+    def __init__(self, pool, dobrar_acentos=True):
+        self.pool = pool
+        self._entradas = {}
+        self._ordenados = None
+        self._indice = IndiceDobrado(acentos=dobrar_acentos)
+        # Incrementada a cada alteração, para detectar escritas durante um `await`
+        self._versao = 0
+
+    # ========== INTERFACE DOS BACKENDS ==========
+
+    async def abrir(self):
+        """Carrega os termos do backend"""
+        raise NotImplementedError
+
+    async def persistir(self):
+        """Grava o estado atual; devolve False se não conseguir"""
+        raise NotImplementedError
+
+    async def fechar(self):
+        """Grava o que estiver pendente e libera os recursos do backend"""
+
+    async def recarregar(self):
+        """Relê os termos do backend sem reiniciar o bot; devolve False se não conseguir"""
+        await self.abrir()
+        return True
+
+    def _novo_indice(self, entradas):
+        """Monta o índice de variantes de `entradas` (pode rodar fora do loop)"""
+        indice = IndiceDobrado(acentos=self._indice.acentos)
+        indice.reconstruir(entradas)
+        return indice
+
+    def _trocar(self, entradas, indice):
+        """Instala termos e índice carregados de uma só vez, sem `await` no meio"""
+        self._entradas = entradas
+        self._indice = indice
+        self._ordenados = None
+        self._versao += 1
+
+    # ========== LEITURA ==========
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __contains__(self, termo):
+        return canonizar(termo) in self._entradas
+
+    def resolver(self, termo):
+        """Chave canônica de qualquer grafia de um termo existente, ou None
+
+        Tenta a chave exata e depois a forma dobrada (sem acentos), ambas O(1).
+        Só para leitura (`!buscar`): "avó" e "avô" são termos diferentes, então
+        escritas usam sempre a chave exata (`obter`, `salvar`, `remover`).
+        """
+        chave = canonizar(termo)
+        if chave in self._entradas:
+            return chave
+        return self._indice.buscar(chave)
+
+    def obter(self, termo):
+        """Devolve a entrada com a chave canônica exata de `termo` ou None"""
+        return self._entradas.get(canonizar(termo))
+
+    def termos(self):
+        """Termos na ordem em que foram adicionados"""
+        return list(self._entradas)
+
+    def termos_ordenados(self):
+        """Termos em ordem alfabética, reordenados só após alterações"""
+        if self._ordenados is None:
+            self._ordenados = sorted(self._entradas)
+        return self._ordenados
+
+    def contar_autores(self):
+        """Contagem de termos por autor, do maior para o menor"""
+        return Counter(dados['autor'] for dados in self._entradas.values()).most_common()
+
+    async def exportar(self, limitar=True):
+        """JSON completo do dicionário, serializado no pool
+
+        Os snapshots de `persistir` usam `limitar=False`: uma gravação nunca
+        pode ser recusada por a fila de tarefas opcionais estar cheia.
+        """
+        return await self.pool.executar(serializar_dicionario, dict(self._entradas), limitar=limitar)
+
+    # ========== ESCRITA ==========
+
+    async def salvar(self, termo, entrada):
+        """Adiciona ou substitui um termo, guardado pela chave canônica"""
+        chave = canonizar(termo)
+        self._entradas[chave] = entrada
+        self._indice.adicionar(chave)
+        self._ordenados = None
+        self._versao += 1
+        return await self.persistir()
+
+    async def remover(self, termo):
+        """Remove um termo existente pela chave canônica exata"""
+        chave = canonizar(termo)
+        del self._entradas[chave]
+        self._indice.remover(chave)
+        self._ordenados = None
+        self._versao += 1
+        return await self.persistir()
+
+    async def importar(self, entradas):
+        """Adiciona os termos que ainda não existem; devolve (novos, ja_existiam)
+
+        As chaves de `entradas` já devem estar canonizadas (ver `preparar_importacao`).
+        """
+        novos = 0
+        for chave, entrada in entradas.items():
+            if chave not in self._entradas:
+                self._entradas[chave] = entrada
+                self._indice.adicionar(chave)
+                novos += 1
+        if novos:
+            self._ordenados = None
+            self._versao += 1
+            await self.persistir()
+        return novos, len(entradas) - novos
+
+
+class MemoriaArmazenamento(Armazenamento):
+    """Mantém os termos só em memória (perdidos ao reiniciar)"""
+
+    nome = 'Memória 🧠'
+
+    async def abrir(self):
+        self._trocar({}, self._novo_indice({}))
+
+    async def persistir(self):
+        return True
+
+    async def recarregar(self):
+        # Não há de onde reler: manter os termos atuais
+        return True
+
+
+class JsonArmazenamento(Armazenamento):
+    """Grava o dicionário completo em um arquivo JSON a cada alteração"""
+
+    nome = 'JSON 💾'
+
+    def __init__(self, pool, arquivo, dobrar_acentos=True):
+        super().__init__(pool, dobrar_acentos)
+        self.arquivo = arquivo
+        # Garante que um snapshot antigo nunca sobrescreva um mais novo
+        self._trava = asyncio.Lock()
+        # Há alterações em memória que ainda não chegaram ao disco
+        self._pendente = False
+
+    def _ler(self):
+        # Arquivos no formato antigo (termo -> texto ou chaves fora da forma
+        # canônica) são migrados na leitura
+        try:
+            entradas, _ = migrar_arquivo(self.arquivo)
+        except FileNotFoundError:
+            entradas = {}
+        return entradas
+
+    def _carregar(self):
+        # Roda em uma thread: leitura, migração e índice ficam fora do loop
+        entradas = self._ler()
+        return entradas, self._novo_indice(entradas)
+
+    def _gravar(self, conteudo):
+        # Grava em um temporário e troca de uma vez: um processo morto no meio
+        # da escrita nunca deixa o arquivo truncado
+        temporario = f'{self.arquivo}.tmp'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            f.write(conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, self.arquivo)
+
+    async def abrir(self):
+        try:
+            entradas, indice = await asyncio.to_thread(self._carregar)
+        except ValueError as e:
+            # Guarda o arquivo ilegível em vez de sobrescrevê-lo no próximo salvamento
+            copia = f'{self.arquivo}.corrompido-{int(time.time())}'
+            os.replace(self.arquivo, copia)
+            logger.error(f"Erro ao carregar {self.arquivo}: {e} (cópia guardada em {copia})")
+            entradas, indice = {}, self._novo_indice({})
+        self._pendente = False
+        self._trocar(entradas, indice)
+
+    async def persistir(self):
+        self._pendente = True
+        try:
+            async with self._trava:
+                # Um salvamento anterior na fila já gravou esta alteração
+                if not self._pendente:
+                    return True
+                self._pendente = False
+                conteudo = await self.exportar(limitar=False)
+                await asyncio.to_thread(self._gravar, conteudo)
+            return True
+        except asyncio.CancelledError:
+            # Interrompido no meio: não dá para saber se a gravação chegou ao disco
+            self._pendente = True
+            raise
+        except Exception as e:
+            self._pendente = True
+            logger.error(f"Erro ao salvar dicionário: {e}")
+            return False
+
+    async def fechar(self):
+        if self._pendente:
+            logger.info(f"💾 Gravando alterações pendentes em {self.arquivo}...")
+            await self.persistir()
+
+    async def recarregar(self):
+        async with self._trava:
+            if self._pendente:
+                logger.error("Recarga cancelada: há alterações que ainda não foram gravadas")
+                return False
+            versao = self._versao
+            try:
+                entradas, indice = await asyncio.to_thread(self._carregar)
+            except ValueError as e:
+                logger.error(f"Recarga cancelada: {self.arquivo} ilegível ({e})")
+                return False
+            # Uma escrita feita durante a leitura ainda não está no arquivo
+            if self._versao != versao:
+                logger.error("Recarga cancelada: o dicionário foi alterado durante a leitura")
+                return False
+            self._trocar(entradas, indice)
+        return True
+
+
+BACKENDS = {
+    'memoria': lambda config, pool: MemoriaArmazenamento(pool, config.dobrar_acentos),
+    'json': lambda config, pool: JsonArmazenamento(pool, config.arquivo, config.dobrar_acentos),
+}
+
+
+def criar_armazenamento(config, pool):
+    """Cria o backend escolhido em `config.backend`"""
+    try:
+        fabrica = BACKENDS[config.backend]
+    except KeyError:
+        raise ValueError(
+            f"Backend desconhecido: {config.backend!r} (opções: {', '.join(BACKENDS)})"
+        ) from None
+    return fabrica(config, pool)
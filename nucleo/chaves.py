@@ -0,0 +1,59 @@
+"""Chaves canônicas dos termos e índice de variantes de grafia"""
+import unicodedata
+
+
+def canonizar(termo):
+    """Chave canônica de um termo: NFKC, casefold e espaços colapsados
+
+    "Ódio", "ódio " e as formas NFC/NFD de "ódio" viram a mesma chave.
+    """
+    texto = unicodedata.normalize('NFKC', termo).casefold()
+    # casefold pode decompor caracteres ("ΐ" vira ι + ̈ + ́); o NFC recompõe
+    # o que tiver forma composta. "İ" continua "i" + U+0307, que não tem.
+    return ' '.join(unicodedata.normalize('NFC', texto).split())
+
+
+def dobrar(chave, acentos=True):
+    """Forma dobrada de uma chave canônica, sem acentos se `acentos` for True"""
+    if not acentos:
+        return chave
+    decomposta = unicodedata.normalize('NFD', chave)
+    sem_acentos = ''.join(c for c in decomposta if not unicodedata.combining(c))
+    return unicodedata.normalize('NFC', sem_acentos)
+
+
+class IndiceDobrado:
+    """Mapeia a forma dobrada de cada chave para as chaves canônicas que a produzem
+
+    Permite achar "ódio" buscando "odio" com uma consulta O(1).
+    """
+
+    def __init__(self, acentos=True):
+        self.acentos = acentos
+        self._formas = {}
+
+    def __len__(self):
+        return len(self._formas)
+
+    def adicionar(self, chave):
+        self._formas.setdefault(dobrar(chave, self.acentos), set()).add(chave)
+
+    def remover(self, chave):
+        forma = dobrar(chave, self.acentos)
+        chaves = self._formas.get(forma)
+        if chaves is not None:
+            chaves.discard(chave)
+            if not chaves:
+                del self._formas[forma]
+
+    def buscar(self, chave):
+        """Chave canônica com a mesma forma dobrada de `chave`, ou None"""
+        chaves = self._formas.get(dobrar(chave, self.acentos))
+        # Mais de uma grafia ("ódio" e "odio"): escolha estável
+        return min(chaves) if chaves else None
+
+    def reconstruir(self, chaves):
+        """Refaz o índice inteiro a partir das chaves canônicas"""
+        self._formas = {}
+        for chave in chaves:
+            self.adicionar(chave)
@@ -0,0 +1,465 @@
+"""Comandos do dicionário, compartilhados por todos os backends"""
+import io
+import logging
+
+import discord
+from discord.ext import commands
+
+from .chaves import canonizar
+from .corpus import carregar_corpus
+from .esquema import agora, nova_entrada
+from .tarefas import PoolOcupado, preparar_importacao
+
+logger = logging.getLogger(__name__)
+
+# Lotes pequenos o bastante para o progresso aparecer já no corpus de Espinosa
+TAMANHO_LOTE_IMPORTACAO = 20
+
+
+def resumir(texto, limite):
+    """Corta `texto` em `limite` caracteres, indicando o corte"""
+    return texto[:limite] + "..." if len(texto) > limite else texto
+
+
+def relatorio_progresso(mensagem, titulo):
+    """Cria um callback que atualiza `mensagem` com o progresso de uma tarefa em lotes"""
+    async def progresso(concluidos, total):
+        if total > 1:
+            await mensagem.edit(content=f"⏳ {titulo}: {concluidos}/{total} lotes")
+    return progresso
+
+
+class Dicionario(commands.Cog):
+    """Comandos para definir, buscar, listar e remover termos"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.config = bot.config
+        self.armazenamento = bot.armazenamento
+        self.pool = bot.pool
+
+    async def atualizar_presenca(self):
+        """Mostra o total de termos no status do bot"""
+        await self.bot.change_presence(
+            activity=discord.Activity(
+                type=discord.ActivityType.watching,
+                name=f"{len(self.armazenamento)} termos | {self.config.prefixo}ajuda"
+            )
+        )
+
+    def pode_alterar(self, ctx, entrada):
+        """Apenas o autor do termo ou um administrador podem alterá-lo"""
+        if not self.config.permissoes:
+            return True
+        e_autor = (str(ctx.author.id) == entrada['autor_id'])
+        permissoes = getattr(ctx.author, 'guild_permissions', None)
+        e_admin = permissoes is not None and permissoes.administrator
+        return e_autor or e_admin
+
+    def validar_limites(self, termo, definicao):
+        """Devolve a mensagem de erro se o termo ou a definição passarem dos limites"""
+        if not self.config.limites:
+            return None
+        if len(termo) > self.config.max_termo:
+            return f"❌ **Termo muito longo!** Máximo {self.config.max_termo} caracteres."
+        if len(definicao) > self.config.max_definicao:
+            return f"❌ **Definição muito longa!** Máximo {self.config.max_definicao} caracteres."
+        return None
+
+    # ========== EVENTOS ==========
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Quando o bot estiver pronto"""
+        logger.info(f'✅ BOT ONLINE: {self.bot.user.name}')
+        logger.info(f'📊 Conectado em {len(self.bot.guilds)} servidor(es)')
+        logger.info(f'📚 Termos no dicionário: {len(self.armazenamento)} ({self.armazenamento.nome})')
+        await self.atualizar_presenca()
+
+    @commands.Cog.listener()
+    async def on_command_error(self, ctx, error):
+        """Tratamento centralizado de erros"""
+        if isinstance(error, commands.CommandNotFound):
+            return  # Ignora comandos não encontrados silenciosamente
+        elif isinstance(error, commands.MissingRequiredArgument):
+            await ctx.send(f"❌ **Argumentos faltando!** Use: `{ctx.command.name} {ctx.command.signature}`")
+        elif isinstance(error, commands.CheckFailure):
+            await ctx.send("❌ **Permissão Negada!** Este comando é restrito.")
+        elif isinstance(getattr(error, 'original', None), PoolOcupado):
+            await ctx.send("⏳ **Bot ocupado!** Há muitas tarefas pesadas na fila, tente novamente em instantes.")
+        else:
+            logger.error(f"Erro no comando {ctx.command}: {error}")
+
+    # ========== COMANDOS PRINCIPAIS ==========
+
+    @commands.command()
+    async def ping(self, ctx):
+        """Testa a conexão do bot"""
+        latency = round(self.bot.latency * 1000)
+
+        embed = discord.Embed(title="🏓 **Pong!**", color=0x00ff00)
+        embed.add_field(name="⚡ Latência", value=f"{latency}ms", inline=True)
+        embed.add_field(name="🖥️ Servidores", value=len(self.bot.guilds), inline=True)
+        embed.add_field(name="📚 Termos", value=len(self.armazenamento), inline=True)
+        embed.add_field(name="💾 Storage", value=self.armazenamento.nome, inline=True)
+        embed.add_field(name="🌐 Host", value="Railway 🚂", inline=True)
+        embed.add_field(name="🔧 Status", value="Online ✅", inline=True)
+
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    async def definir(self, ctx, termo: str, *, definicao: str):
+        """Adiciona um novo termo ao dicionário"""
+        termo = canonizar(termo)
+
+        erro = self.validar_limites(termo, definicao)
+        if erro:
+            await ctx.send(erro)
+            return
+
+        existente = self.armazenamento.obter(termo)
+        if existente:
+            embed = discord.Embed(
+                title="⚠️ **Termo Já Existe**",
+                description=f"O termo `{termo}` já existe no dicionário.",
+                color=0xffa500
+            )
+            embed.add_field(name="📝 Definição Atual", value=resumir(existente['definicao'], 200), inline=False)
+            embed.add_field(
+                name="Ação",
+                value=f"Use `{self.config.prefixo}editar` para modificar a definição.",
+                inline=False
+            )
+            await ctx.send(embed=embed)
+            return
+
+        entrada = nova_entrada(definicao, ctx.author.display_name, ctx.author.id)
+        if await self.armazenamento.salvar(termo, entrada):
+            embed = discord.Embed(
+                title="✅ **Termo Adicionado**",
+                description=f"**{termo}** foi adicionado ao dicionário!",
+                color=0x00ff00
+            )
+            embed.add_field(name="📝 Definição", value=resumir(definicao, 300), inline=False)
+            embed.set_footer(text=f"Por {ctx.author.display_name}")
+            await self.atualizar_presenca()
+        else:
+            embed = discord.Embed(
+                title="❌ **Erro ao Salvar**",
+                description="Ocorreu um erro ao salvar o termo. Tente novamente.",
+                color=0xff0000
+            )
+
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    async def editar(self, ctx, termo: str, *, definicao: str):
+        """Edita a definição de um termo"""
+        termo = canonizar(termo)
+
+        erro = self.validar_limites(termo, definicao)
+        if erro:
+            await ctx.send(erro)
+            return
+
+        entrada = self.armazenamento.obter(termo)
+        if entrada is None:
+            embed = discord.Embed(
+                title="❌ **Termo Não Encontrado**",
+                description=f"O termo `{termo}` não existe no dicionário.",
+                color=0xff0000
+            )
+            await ctx.send(embed=embed)
+            return
+
+        if not self.pode_alterar(ctx, entrada):
+            embed = discord.Embed(
+                title="❌ **Permissão Negada**",
+                description=f"Apenas **{entrada['autor']}** ou um **Administrador** podem editar este termo.",
+                color=0xff0000
+            )
+            await ctx.send(embed=embed)
+            return
+
+        # Mantém o autor original, atualiza definição e data
+        atualizada = {**entrada, 'definicao': definicao, 'data': agora()}
+        if await self.armazenamento.salvar(termo, atualizada):
+            embed = discord.Embed(
+                title="✏️ **Termo Atualizado**",
+                description=f"**{termo}** foi atualizado!",
+                color=0xffa500
+            )
+            embed.add_field(name="📝 Definição", value=resumir(definicao, 300), inline=False)
+            embed.set_footer(text=f"Editado por {ctx.author.display_name}")
+        else:
+            embed = discord.Embed(
+                title="❌ **Erro ao Salvar**",
+                description="Ocorreu um erro ao salvar o termo. Tente novamente.",
+                color=0xff0000
+            )
+
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    async def buscar(self, ctx, *, termo: str):
+        """Busca a definição de um termo"""
+        termo = canonizar(termo)
+        # Única consulta que aceita variantes sem acento ("odio" acha "ódio")
+        chave = self.armazenamento.resolver(termo)
+
+        if chave is not None:
+            dados = self.armazenamento.obter(chave)
+            embed = discord.Embed(
+                title=f"📖 **{chave.upper()}**",
+                description=dados['definicao'],
+                color=0x0099ff
+            )
+            embed.add_field(name="👤 Autor", value=dados['autor'], inline=True)
+            embed.add_field(name="📅 Data", value=dados['data'], inline=True)
+        else:
+            embed = discord.Embed(
+                title="❌ **Termo Não Encontrado**",
+                description=f"`{termo}` não existe no dicionário.",
+                color=0xff0000
+            )
+            embed.add_field(
+                name="💡 Dica",
+                value=f"Use `{self.config.prefixo}definir` para adicionar este termo",
+                inline=False
+            )
+
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    async def listar(self, ctx, pagina: int = 1):
+        """Lista todos os termos com paginação"""
+        if not len(self.armazenamento):
+            embed = discord.Embed(
+                title="📚 **Dicionário Vazio**",
+                description=(
+                    f"Use `{self.config.prefixo}definir` para adicionar o primeiro termo!\n"
+                    f"Exemplo: `{self.config.prefixo}definir filosofia estudo da existência`"
+                ),
+                color=0xff0000
+            )
+            await ctx.send(embed=embed)
+            return
+
+        termos = self.armazenamento.termos_ordenados()
+
+        # Paginação
+        itens_por_pagina = self.config.itens_por_pagina
+        total_paginas = (len(termos) + itens_por_pagina - 1) // itens_por_pagina
+
+        if pagina < 1:
+            pagina = 1
+        elif pagina > total_paginas:
+            pagina = total_paginas
+
+        inicio = (pagina - 1) * itens_por_pagina
+        fim = inicio + itens_por_pagina
+        termos_pagina = termos[inicio:fim]
+
+        embed = discord.Embed(
+            title="📚 **Todos os Termos**",
+            color=0x9370db
+        )
+
+        lista_termos = "\n".join([f"• **{termo}**" for termo in termos_pagina])
+        embed.description = lista_termos
+
+        embed.set_footer(
+            text=f"Página {pagina}/{total_paginas} • Total: {len(termos)} termos • "
+                 f"Use {self.config.prefixo}buscar <termo>"
+        )
+
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    async def remover(self, ctx, *, termo: str):
+        """Remove um termo do dicionário"""
+        termo = canonizar(termo)
+        entrada = self.armazenamento.obter(termo)
+
+        if entrada is None:
+            embed = discord.Embed(
+                title="❌ **Termo Não Encontrado**",
+                description=f"O termo `{termo}` não existe no dicionário.",
+                color=0xff0000
+            )
+            await ctx.send(embed=embed)
+            return
+
+        if not self.pode_alterar(ctx, entrada):
+            embed = discord.Embed(
+                title="❌ **Permissão Negada**",
+                description=f"Apenas **{entrada['autor']}** ou um **Administrador** podem remover este termo.",
+                color=0xff0000
+            )
+            await ctx.send(embed=embed)
+            return
+
+        if await self.armazenamento.remover(termo):
+            embed = discord.Embed(
+                title="🗑️ **Termo Removido**",
+                description=f"**{termo}** foi removido do dicionário.",
+                color=0x00ff00
+            )
+            embed.add_field(name="📝 Definição Removida", value=resumir(entrada['definicao'], 200), inline=False)
+            embed.add_field(name="👤 Autor Original", value=entrada['autor'], inline=True)
+            embed.add_field(name="🔧 Removido por", value=ctx.author.display_name, inline=True)
+            await self.atualizar_presenca()
+        else:
+            embed = discord.Embed(
+                title="❌ **Erro ao Remover**",
+                description="Ocorreu um erro ao remover o termo. Tente novamente.",
+                color=0xff0000
+            )
+
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    async def carregar_espinosa(self, ctx):
+        """Carrega TODOS os termos da Ética de Espinosa"""
+        termos_espinosa = carregar_corpus('espinosa')
+
+        # Monta as entradas no pool de processos para não travar os outros comandos
+        mensagem = await ctx.send("⏳ Importando termos da Ética...")
+        lotes = await self.pool.executar_em_lotes(
+            preparar_importacao,
+            list(termos_espinosa.items()),
+            "Baruch Espinosa - Ética",
+            "espinosa_system",
+            agora(),
+            tamanho_lote=TAMANHO_LOTE_IMPORTACAO,
+            progresso=relatorio_progresso(mensagem, "Importando termos da Ética")
+        )
+
+        entradas = {}
+        for lote in lotes:
+            entradas.update(lote)
+        carregados, ja_existiam = await self.armazenamento.importar(entradas)
+
+        await self.atualizar_presenca()
+
+        embed = discord.Embed(
+            title="📚 **ÉTICA DE ESPINOSA - CARREGADA**",
+            description=f"**{carregados} novos termos** foram adicionados ao dicionário!",
+            color=0x9370db
+        )
+
+        embed.add_field(
+            name="📖 Obra Completa",
+            value="**Ética Demonstrada à Maneira dos Geômetras**\n*Baruch Espinosa (1677)*",
+            inline=False
+        )
+
+        embed.add_field(name="✅ Novos termos", value=carregados, inline=True)
+        embed.add_field(name="📊 Total no dicionário", value=len(self.armazenamento), inline=True)
+
+        if ja_existiam > 0:
+            embed.add_field(
+                name="ℹ️ Termos existentes",
+                value=f"{ja_existiam} termos já estavam no dicionário",
+                inline=False
+            )
+
+        p = self.config.prefixo
+        embed.add_field(
+            name="🔍 Exemplos para testar",
+            value=f"`{p}buscar deus` `{p}buscar conatus` `{p}buscar beatitude`",
+            inline=False
+        )
+
+        embed.set_footer(text=f"Use {p}listar para ver todos os termos disponíveis")
+
+        await mensagem.edit(content=None, embed=embed)
+
+    @commands.command()
+    async def exportar(self, ctx):
+        """Exporta o dicionário completo como arquivo JSON"""
+        if not len(self.armazenamento):
+            await ctx.send("📚 **Dicionário Vazio!** Nada para exportar.")
+            return
+
+        mensagem = await ctx.send(f"⏳ Exportando {len(self.armazenamento)} termos...")
+
+        # A serialização roda no pool de processos
+        conteudo = await self.armazenamento.exportar()
+        arquivo = discord.File(io.BytesIO(conteudo.encode('utf-8')), filename='dicionario.json')
+
+        await mensagem.edit(content=f"📦 **Exportação concluída:** {len(self.armazenamento)} termos")
+        await ctx.send(file=arquivo)
+
+    @commands.command()
+    async def ajuda(self, ctx):
+        """Mostra todos os comandos disponíveis"""
+        embed = discord.Embed(
+            title="📚 **COMANDOS DO DICIONÁRIO**",
+            description="Aqui estão todos os comandos disponíveis:",
+            color=0x00ff00
+        )
+
+        p = self.config.prefixo
+        comandos = [
+            (f"`{p}ping`", "Testa a conexão do bot e mostra estatísticas"),
+            (f"`{p}definir <termo> <definição>`", "Adiciona um novo termo"),
+            (f"`{p}editar <termo> <nova_definição>`", "Edita a definição de um termo"),
+            (f"`{p}buscar <termo>`", "Busca a definição de um termo"),
+            (f"`{p}listar [página]`", f"Lista todos os termos ({self.config.itens_por_pagina} por página)"),
+            (f"`{p}remover <termo>`", "Remove um termo" + (" (autor ou admin)" if self.config.permissoes else "")),
+            (f"`{p}estatisticas`", "Mostra estatísticas do dicionário"),
+            (f"`{p}exportar`", "Exporta o dicionário completo em JSON"),
+            (f"`{p}ajuda`", "Mostra esta mensagem de ajuda")
+        ]
+        if self.config.espinosa:
+            comandos.insert(-1, (f"`{p}carregar_espinosa`", "Carrega TODOS os termos da Ética de Espinosa"))
+
+        for nome, descricao in comandos:
+            embed.add_field(name=nome, value=descricao, inline=False)
+
+        embed.set_footer(text=f"Bot: {self.bot.user.name} | Online ✅ | Total: {len(self.armazenamento)} termos")
+
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    async def estatisticas(self, ctx):
+        """Mostra estatísticas detalhadas do dicionário"""
+        total_termos = len(self.armazenamento)
+
+        # Contagem por autor, já ordenada
+        autores_ordenados = self.armazenamento.contar_autores()
+
+        embed = discord.Embed(
+            title="📊 **ESTATÍSTICAS DO DICIONÁRIO**",
+            color=0x9370db
+        )
+
+        embed.add_field(name="📚 Total de Termos", value=total_termos, inline=True)
+        embed.add_field(name="🖥️ Servidores", value=len(self.bot.guilds), inline=True)
+        embed.add_field(name="⚡ Latência", value=f"{round(self.bot.latency * 1000)}ms", inline=True)
+
+        if autores_ordenados:
+            top_autores = "\n".join([f"• **{autor}**: {qtd} termos" for autor, qtd in autores_ordenados[:5]])
+            embed.add_field(
+                name="👥 Principais Autores",
+                value=top_autores,
+                inline=False
+            )
+
+        if total_termos > 0:
+            ultimos_termos = self.armazenamento.termos()[-3:]
+            embed.add_field(
+                name="🆕 Últimos Termos Adicionados",
+                value=", ".join(ultimos_termos),
+                inline=False
+            )
+
+        await ctx.send(embed=embed)
+
+
+async def setup(bot):
+    """Carrega os comandos como extensão (`bot.load_extension('nucleo.comandos')`)"""
+    await bot.add_cog(Dicionario(bot))
+    if not bot.config.espinosa:
+        bot.remove_command('carregar_espinosa')
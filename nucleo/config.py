@@ -0,0 +1,58 @@
+"""Configuração do bot lida das variáveis de ambiente"""
+import os
+from dataclasses import dataclass, fields
+
+
+@dataclass
+class Configuracao:
+    """Backends e recursos ativos no bot"""
+    token: str = ''
+    prefixo: str = '!'
+    backend: str = 'json'
+    arquivo: str = 'dicionario.json'
+    permissoes: bool = True
+    limites: bool = True
+    max_termo: int = 50
+    max_definicao: int = 1000
+    itens_por_pagina: int = 15
+    espinosa: bool = True
+    dobrar_acentos: bool = True
+    max_processos: int = 1
+    tempo_encerramento: int = 20
+
+
+# Variável de ambiente correspondente a cada campo da configuração
+VARIAVEIS = {
+    'token': 'DISCORD_TOKEN',
+    'prefixo': 'BOT_PREFIXO',
+    'backend': 'DICIONARIO_BACKEND',
+    'arquivo': 'DICIONARIO_ARQUIVO',
+    'permissoes': 'DICIONARIO_PERMISSOES',
+    'limites': 'DICIONARIO_LIMITES',
+    'max_termo': 'DICIONARIO_MAX_TERMO',
+    'max_definicao': 'DICIONARIO_MAX_DEFINICAO',
+    'itens_por_pagina': 'DICIONARIO_ITENS_POR_PAGINA',
+    'espinosa': 'DICIONARIO_ESPINOSA',
+    'dobrar_acentos': 'DICIONARIO_DOBRAR_ACENTOS',
+    'max_processos': 'DICIONARIO_MAX_PROCESSOS',
+    'tempo_encerramento': 'DICIONARIO_TEMPO_ENCERRAMENTO',
+}
+
+
+def _converter(valor, tipo):
+    if tipo is bool:
+        return valor.strip().lower() in ('1', 'true', 'sim', 'yes', 'on')
+    return tipo(valor)
+
+
+def carregar_configuracao(**padroes):
+    """Monta a configuração a partir de `padroes` e das variáveis de ambiente
+
+    As variáveis de ambiente têm prioridade sobre os padrões informados.
+    """
+    config = Configuracao(**padroes)
+    for campo in fields(Configuracao):
+        valor = os.environ.get(VARIAVEIS[campo.name])
+        if valor is not None:
+            setattr(config, campo.name, _converter(valor, campo.type))
+    return config
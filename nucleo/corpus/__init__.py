@@ -0,0 +1,11 @@
+"""Corpora de termos prontos para importação (ex.: Ética de Espinosa)"""
+import json
+import os
+
+PASTA_CORPUS = os.path.dirname(os.path.abspath(__file__))
+
+
+def carregar_corpus(nome):
+    """Lê o corpus `<nome>.json` e devolve um dict termo -> definição"""
+    with open(os.path.join(PASTA_CORPUS, f'{nome}.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
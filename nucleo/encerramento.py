@@ -0,0 +1,62 @@
+"""Desligamento ordenado do bot, separado do discord.py para poder ser testado"""
+import asyncio
+import contextlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Encerramento:
+    """Conta os comandos em andamento e conduz o desligamento
+
+    Ao encerrar: para de aceitar comandos, espera os que estão em andamento
+    (até `tempo` segundos), grava o que estiver pendente, encerra o pool de
+    processos e só então desconecta.
+    """
+
+    def __init__(self, armazenamento, pool, tempo=20):
+        self.armazenamento = armazenamento
+        self.pool = pool
+        self.tempo = tempo
+        self.encerrando = False
+        self.em_andamento = 0
+        self._ocioso = asyncio.Event()
+        self._ocioso.set()
+
+    @contextlib.asynccontextmanager
+    async def comando(self):
+        """Marca um comando como em andamento enquanto o bloco roda"""
+        self.em_andamento += 1
+        self._ocioso.clear()
+        try:
+            yield
+        finally:
+            self.em_andamento -= 1
+            if self.em_andamento == 0:
+                self._ocioso.set()
+
+    async def liberar(self):
+        """Grava as alterações pendentes e encerra o pool de processos"""
+        await self.armazenamento.fechar()
+        self.pool.encerrar()
+
+    async def encerrar(self, desconectar, motivo='pedido'):
+        """Espera os comandos, libera os recursos e chama `desconectar`
+
+        Devolve False se um encerramento já estava em curso.
+        """
+        if self.encerrando:
+            return False
+        self.encerrando = True
+        logger.info(f"🛑 Encerrando ({motivo}): aguardando {self.em_andamento} comando(s) em andamento...")
+
+        try:
+            await asyncio.wait_for(self._ocioso.wait(), timeout=self.tempo)
+        except asyncio.TimeoutError:
+            logger.error(f"⚠️ {self.em_andamento} comando(s) não terminaram a tempo")
+
+        # Grava antes de desconectar: depois do close() do discord.py nada
+        # garante que o loop ainda vá rodar esta tarefa até o fim
+        await self.liberar()
+        await desconectar()
+        return True
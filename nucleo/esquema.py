@@ -0,0 +1,41 @@
+"""Formato das entradas do dicionário, compartilhado por todos os backends"""
+from datetime import datetime
+
+# Entradas antigas (só com a definição) não têm autor nem data
+AUTOR_LEGADO = 'Desconhecido'
+AUTOR_ID_LEGADO = 'legado'
+DATA_LEGADO = 'Desconhecida'
+
+CAMPOS = ('definicao', 'autor', 'autor_id', 'data')
+
+
+def agora():
+    """Data e hora atuais no formato exibido pelo bot"""
+    return datetime.now().strftime('%d/%m/%Y %H:%M')
+
+
+def nova_entrada(definicao, autor, autor_id, data=None):
+    """Cria uma entrada completa do dicionário"""
+    return {
+        'definicao': definicao,
+        'autor': autor,
+        'autor_id': str(autor_id),
+        'data': data or agora()
+    }
+
+
+def migrar_entrada(valor):
+    """Converte um valor de qualquer formato conhecido para uma entrada completa
+
+    Devolve `(entrada, alterada)`; `alterada` indica que o valor estava no
+    formato antigo (texto puro) ou sem algum campo.
+    """
+    if isinstance(valor, str):
+        return nova_entrada(valor, AUTOR_LEGADO, AUTOR_ID_LEGADO, DATA_LEGADO), True
+
+    if isinstance(valor, dict) and isinstance(valor.get('definicao'), str):
+        padrao = nova_entrada(valor['definicao'], AUTOR_LEGADO, AUTOR_ID_LEGADO, DATA_LEGADO)
+        faltando = [campo for campo in CAMPOS if campo not in valor]
+        return {**padrao, **valor}, bool(faltando)
+
+    raise ValueError(f'Entrada inválida: {valor!r}')
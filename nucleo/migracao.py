@@ -0,0 +1,165 @@
+"""Migração do `dicionario.json` antigo (termo -> texto) para o formato de entradas
+
+Uso manual: python -m nucleo.migracao [arquivo]
+"""
+import json
+import logging
+import os
+import re
+import sys
+
+from .chaves import canonizar
+from .esquema import migrar_entrada
+
+logger = logging.getLogger(__name__)
+
+_ESPACOS = re.compile(r'\s*')
+
+
+def _pular_espacos(texto, pos):
+    return _ESPACOS.match(texto, pos).end()
+
+
+def iterar_pares(texto):
+    """Percorre os pares (chave, valor) de um objeto JSON de nível superior, um de cada vez
+
+    Diferente de `json.loads`, não monta o objeto inteiro: cada valor é
+    decodificado e entregue antes de o próximo ser decodificado. O texto
+    em si já precisa estar todo em memória.
+    """
+    decodificador = json.JSONDecoder()
+    pos = _pular_espacos(texto, 0)
+    if texto[pos:pos + 1] != '{':
+        raise ValueError('O arquivo não contém um objeto JSON')
+    pos = _pular_espacos(texto, pos + 1)
+    if texto[pos:pos + 1] == '}':
+        return
+
+    while True:
+        chave, pos = decodificador.raw_decode(texto, pos)
+        if not isinstance(chave, str):
+            raise ValueError(f'Chave inválida na posição {pos}')
+        pos = _pular_espacos(texto, pos)
+        if texto[pos:pos + 1] != ':':
+            raise ValueError(f'":" esperado na posição {pos}')
+        valor, pos = decodificador.raw_decode(texto, _pular_espacos(texto, pos + 1))
+        yield chave, valor
+
+        pos = _pular_espacos(texto, pos)
+        separador = texto[pos:pos + 1]
+        if separador == '}':
+            if texto[pos + 1:].strip():
+                raise ValueError(f'Conteúdo inesperado após a posição {pos}')
+            return
+        if separador != ',':
+            raise ValueError(f'"," ou "}}" esperado na posição {pos}')
+        pos = _pular_espacos(texto, pos + 1)
+
+
+def _gravar_separados(destino, sufixo, itens):
+    """Grava entradas postas de lado em um arquivo novo ao lado de `destino`
+
+    Nunca sobrescreve o de uma migração anterior: usa `<destino>.<sufixo>`,
+    `<destino>.<sufixo>-2`... Devolve o caminho usado.
+    """
+    caminho = f'{destino}.{sufixo}'
+    numero = 2
+    while os.path.exists(caminho):
+        caminho = f'{destino}.{sufixo}-{numero}'
+        numero += 1
+
+    _gravar_json(caminho, itens)
+    return caminho
+
+
+def _gravar_json(caminho, dados):
+    temporario = f'{caminho}.tmp'
+    try:
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+
+
+def migrar_arquivo(origem, destino=None):
+    """Lê `origem` e, se estiver no formato antigo, grava a versão migrada em `destino`
+
+    O texto é decodificado uma única vez, par a par: cada valor é migrado
+    para o formato de entradas e cada termo vai para a chave canônica
+    enquanto os pares são percorridos. No caso comum (nada a migrar e
+    `destino` igual a `origem`) nada é escrito.
+
+    Quando várias grafias viram a mesma chave ("Deus" e "deus"), vence a que
+    já estava na forma canônica (a que o `!buscar` antigo encontrava); sem
+    ela, vence a primeira do arquivo. As demais vão para
+    `<destino>.colisoes`. Valores que não são entradas reconhecíveis (null,
+    números, listas) e termos vazios vão para `<destino>.invalidos`. Os dois
+    são gravados antes de o arquivo original ser substituído, e os termos
+    válidos são sempre mantidos. Devolve `(entradas, migradas)`.
+    """
+    destino = destino or origem
+
+    with open(origem, 'r', encoding='utf-8') as f:
+        texto = f.read()
+
+    entradas = {}
+    # Grafia original de cada chave, para decidir as colisões
+    originais = {}
+    colisoes = []
+    invalidos = []
+    migradas = 0
+    for termo, valor in iterar_pares(texto):
+        chave = canonizar(termo)
+        try:
+            if not chave:
+                raise ValueError('Termo vazio')
+            entrada, alterada = migrar_entrada(valor)
+        except ValueError:
+            invalidos.append({'termo': termo, 'valor': valor})
+            migradas += 1
+            continue
+
+        if chave in entradas:
+            anterior = originais[chave]
+            if termo != chave or anterior == chave:
+                colisoes.append({'termo': termo, 'chave': chave, 'entrada': entrada})
+                migradas += 1
+                continue
+            # A grafia canônica apareceu depois: a que ocupava a chave sai
+            # (já contada como migrada, pois estava fora da forma canônica)
+            colisoes.append({'termo': anterior, 'chave': chave, 'entrada': entradas[chave]})
+        migradas += alterada or chave != termo
+        entradas[chave] = entrada
+        originais[chave] = termo
+
+    if not migradas and destino == origem:
+        return entradas, 0
+
+    # O que foi posto de lado precisa estar seguro antes de o original sumir
+    if colisoes:
+        arquivo_colisoes = _gravar_separados(destino, 'colisoes', colisoes)
+        logger.warning(
+            f'⚠️ {len(colisoes)} termo(s) com a mesma chave de outro termo '
+            f'guardados em {arquivo_colisoes}'
+        )
+    if invalidos:
+        arquivo_invalidos = _gravar_separados(destino, 'invalidos', invalidos)
+        logger.warning(f'⚠️ {len(invalidos)} termo(s) inválidos guardados em {arquivo_invalidos}')
+
+    _gravar_json(destino, entradas)
+
+    if migradas:
+        logger.info(f'🔄 {migradas} termo(s) migrados para o formato novo em {destino}')
+    return entradas, migradas
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    arquivo = sys.argv[1] if len(sys.argv) > 1 else 'dicionario.json'
+    entradas, migradas = migrar_arquivo(arquivo)
+    print(f'{migradas} de {len(entradas)} termos migrados em {arquivo}')
@@ -0,0 +1,96 @@
+"""Ponto de entrada do bot: monta configuração, armazenamento e comandos"""
+import asyncio
+import logging
+import signal
+
+import discord
+from discord.ext import commands
+
+from .armazenamento import criar_armazenamento
+from .config import carregar_configuracao
+from .encerramento import Encerramento
+from .tarefas import PoolDeTarefas
+
+logger = logging.getLogger(__name__)
+
+EXTENSOES = ['nucleo.comandos', 'nucleo.admin']
+
+
+class BotDicionario(commands.Bot):
+    """Bot com a configuração, o pool de tarefas e o armazenamento anexados"""
+
+    def __init__(self, config):
+        intents = discord.Intents.default()
+        intents.message_content = True
+
+        super().__init__(
+            command_prefix=config.prefixo,
+            intents=intents,
+            help_command=None  # Isso evita duplicação do comando de ajuda padrão
+        )
+        self.config = config
+        self.extensoes = list(EXTENSOES)
+        self.pool = PoolDeTarefas(max_processos=config.max_processos)
+        self.armazenamento = criar_armazenamento(config, self.pool)
+
+        # Comandos em andamento, esperados antes de encerrar
+        self.encerramento = Encerramento(self.armazenamento, self.pool, config.tempo_encerramento)
+        # Referência forte: o asyncio só guarda referências fracas às tarefas
+        self._tarefa_encerramento = None
+
+    async def setup_hook(self):
+        await self.armazenamento.abrir()
+        logger.info(f'📚 {len(self.armazenamento)} termos carregados ({self.armazenamento.nome})')
+        for extensao in self.extensoes:
+            await self.load_extension(extensao)
+
+        loop = asyncio.get_running_loop()
+        for sinal in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sinal, self._ao_receber_sinal, sinal)
+            except NotImplementedError:
+                pass  # Windows: só o Ctrl+C padrão do discord.py
+
+    def _ao_receber_sinal(self, sinal):
+        if self._tarefa_encerramento is None:
+            self._tarefa_encerramento = asyncio.create_task(self.encerrar(sinal))
+
+    async def invoke(self, ctx):
+        if self.encerramento.encerrando:
+            if ctx.command is not None:
+                await ctx.send("🔄 **Bot reiniciando!** Tente novamente em instantes.")
+            return
+
+        async with self.encerramento.comando():
+            await super().invoke(ctx)
+
+    async def encerrar(self, sinal=None):
+        """Para de aceitar comandos, espera os que estão em andamento e fecha o bot"""
+        nome = signal.Signals(sinal).name if sinal else 'pedido'
+        await self.encerramento.encerrar(self.close, nome)
+
+    async def close(self):
+        # Caminhos que não passam por encerrar() (Ctrl+C no Windows, erro de
+        # login): grava o que estiver pendente depois de desconectar
+        await super().close()
+        await self.encerramento.liberar()
+        logger.info("👋 Bot encerrado")
+
+
+def main(**padroes):
+    """Inicia o bot; `padroes` são sobrescritos pelas variáveis de ambiente"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s | %(levelname)s | %(message)s',
+        datefmt='%H:%M:%S'
+    )
+
+    config = carregar_configuracao(**padroes)
+    if not config.token:
+        logger.error("❌ Token do Discord não encontrado!")
+        logger.info("💡 Verifique se a variável DISCORD_TOKEN está configurada no Railway")
+        raise SystemExit(1)
+
+    logger.info(f"🚀 Iniciando bot Discord (backend: {config.backend})...")
+    bot = BotDicionario(config)
+    bot.run(config.token, log_handler=None)
@@ -0,0 +1,145 @@
+"""Pool de processos para tarefas pesadas de CPU (importações, exportações, snapshots)"""
+import asyncio
+import json
+import logging
+import multiprocessing
+import signal
+from concurrent.futures import ProcessPoolExecutor
+
+from .chaves import canonizar
+from .esquema import nova_entrada
+
+logger = logging.getLogger(__name__)
+
+# Poucos processos fixos: os.cpu_count() enxerga as CPUs do host, não as do
+# container. Use DICIONARIO_MAX_PROCESSOS para aumentar.
+MAX_PROCESSOS_PADRAO = 1
+
+
+class PoolOcupado(Exception):
+    """A fila de tarefas pesadas está cheia"""
+
+
+# ========== FUNÇÕES EXECUTADAS NOS PROCESSOS ==========
+# Precisam ficar no nível do módulo para serem enviadas aos processos (pickle).
+# Só vale a pena mandar ao pool o que custa mais que o pickle de ida e volta:
+# ordenação e contagens (C puro) ficam no processo principal.
+
+def _ignorar_sinais():
+    # O encerramento é conduzido pelo processo principal, que espera as
+    # tarefas em andamento antes de fechar o pool
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def preparar_importacao(itens, autor, autor_id, data):
+    """Monta as entradas de um lote de pares (termo, definição) para importação"""
+    return {
+        canonizar(termo): nova_entrada(definicao, autor, autor_id, data)
+        for termo, definicao in itens
+    }
+
+
+def serializar_dicionario(dicionario):
+    """Gera o JSON completo do dicionário (exportação e snapshot em disco)"""
+    return json.dumps(dicionario, ensure_ascii=False, indent=2)
+
+
+def dividir_em_lotes(itens, tamanho_lote):
+    """Divide uma lista em lotes de no máximo `tamanho_lote` itens"""
+    return [itens[i:i + tamanho_lote] for i in range(0, len(itens), tamanho_lote)]
+
+
+# ========== POOL DE PROCESSOS ==========
+
+class PoolDeTarefas:
+    """Executa tarefas pesadas de CPU em processos separados
+
+    O loop do asyncio continua livre para os comandos interativos
+    (`!buscar`, `!ping`...) enquanto importações, exportações e snapshots
+    rodam em paralelo.
+    """
+
+    def __init__(self, max_processos=None, max_pendentes=8):
+        self.max_processos = max_processos or MAX_PROCESSOS_PADRAO
+        self.max_pendentes = max_pendentes
+        self._executor = None
+        self._vagas = asyncio.Semaphore(self.max_processos)
+        self._pendentes = 0
+
+    @property
+    def pendentes(self):
+        return self._pendentes
+
+    def _obter_executor(self):
+        # Os processos só são criados na primeira tarefa pesada. forkserver em
+        # vez de fork: o bot já tem threads rodando (to_thread, aiohttp)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_processos,
+                mp_context=multiprocessing.get_context('forkserver'),
+                initializer=_ignorar_sinais
+            )
+            logger.info(f'⚙️ Pool de tarefas iniciado com {self.max_processos} processo(s)')
+        return self._executor
+
+    def _reservar(self, limitar=True):
+        if limitar and self._pendentes >= self.max_pendentes:
+            raise PoolOcupado(f'{self._pendentes} tarefas pesadas na fila')
+        self._pendentes += 1
+
+    async def _submeter(self, funcao, *args):
+        async with self._vagas:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._obter_executor(), funcao, *args)
+
+    async def executar(self, funcao, *args, limitar=True):
+        """Executa `funcao(*args)` em outro processo e devolve o resultado
+
+        Levanta `PoolOcupado` se a fila já tiver `max_pendentes` tarefas,
+        a não ser com `limitar=False` (gravações que não podem ser
+        recusadas). Se a tarefa que aguarda for cancelada, o trabalho que
+        ainda não começou é cancelado no pool também.
+        """
+        self._reservar(limitar)
+        try:
+            return await self._submeter(funcao, *args)
+        finally:
+            self._pendentes -= 1
+
+    async def executar_em_lotes(self, funcao, itens, *args, tamanho_lote=500, progresso=None):
+        """Divide `itens` em lotes, processa cada lote no pool e devolve os resultados em ordem
+
+        Conta como uma única tarefa na fila. `progresso`, se informado, é uma
+        corrotina chamada como `await progresso(lotes_concluidos, total_lotes)`
+        a cada lote terminado.
+        """
+        lotes = dividir_em_lotes(list(itens), tamanho_lote)
+        total = len(lotes)
+        concluidos = 0
+
+        async def processar(lote):
+            nonlocal concluidos
+            resultado = await self._submeter(funcao, lote, *args)
+            concluidos += 1
+            if progresso is not None:
+                await progresso(concluidos, total)
+            return resultado
+
+        self._reservar()
+        try:
+            # Se um lote falhar ou o comando for cancelado, o TaskGroup cancela os demais
+            async with asyncio.TaskGroup() as grupo:
+                tarefas = [grupo.create_task(processar(lote)) for lote in lotes]
+        except ExceptionGroup as erros:
+            raise erros.exceptions[0]
+        finally:
+            self._pendentes -= 1
+        return [tarefa.result() for tarefa in tarefas]
+
+    def encerrar(self):
+        """Encerra os processos, descartando tarefas que ainda não começaram"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info('⚙️ Pool de tarefas encerrado')
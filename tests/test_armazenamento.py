@@ -0,0 +1,240 @@
+import asyncio
+import json
+import threading
+import time
+
+from nucleo.armazenamento import JsonArmazenamento, MemoriaArmazenamento
+from nucleo.esquema import nova_entrada
+from nucleo.tarefas import PoolDeTarefas
+
+
+def rodar(corrotina):
+    return asyncio.run(corrotina)
+
+
+def entrada(definicao='def', autor='ana'):
+    return nova_entrada(definicao, autor, 1, data='01/01/2024 00:00')
+
+
+def test_salvar_com_fila_cheia_ainda_grava(tmp_path):
+    arquivo = tmp_path / 'd.json'
+
+    async def cenario():
+        pool = PoolDeTarefas(max_processos=1, max_pendentes=1)
+        armazenamento = JsonArmazenamento(pool, str(arquivo))
+        await armazenamento.abrir()
+        # Ocupa a única vaga da fila de tarefas opcionais
+        pool._reservar()
+        try:
+            return await armazenamento.salvar('termo', entrada())
+        finally:
+            pool._pendentes -= 1
+            pool.encerrar()
+
+    assert rodar(cenario()) is True
+    assert list(json.loads(arquivo.read_text(encoding='utf-8'))) == ['termo']
+
+
+def test_termos_ordenados_reflete_escritas():
+    async def cenario():
+        pool = PoolDeTarefas(max_processos=1)
+        armazenamento = MemoriaArmazenamento(pool)
+        await armazenamento.abrir()
+        await armazenamento.salvar('beta', entrada())
+        assert armazenamento.termos_ordenados() == ['beta']
+        await armazenamento.salvar('alfa', entrada())
+        await armazenamento.salvar('zzz novo', entrada())
+        return armazenamento.termos_ordenados()
+
+    assert rodar(cenario()) == ['alfa', 'beta', 'zzz novo']
+
+
+def test_contar_autores():
+    async def cenario():
+        armazenamento = MemoriaArmazenamento(PoolDeTarefas(max_processos=1))
+        await armazenamento.abrir()
+        await armazenamento.salvar('a', entrada(autor='ana'))
+        await armazenamento.salvar('b', entrada(autor='bia'))
+        await armazenamento.salvar('c', entrada(autor='ana'))
+        return armazenamento.contar_autores()
+
+    assert rodar(cenario()) == [('ana', 2), ('bia', 1)]
+
+
+def test_salvamentos_simultaneos_sao_agrupados(tmp_path):
+    arquivo = tmp_path / 'd.json'
+
+    async def cenario():
+        pool = PoolDeTarefas(max_processos=1)
+        armazenamento = JsonArmazenamento(pool, str(arquivo))
+        await armazenamento.abrir()
+        gravacoes = []
+        gravar = armazenamento._gravar
+        armazenamento._gravar = lambda conteudo: (gravacoes.append(1), gravar(conteudo))
+        try:
+            resultados = await asyncio.gather(
+                *(armazenamento.salvar(f'termo {i}', entrada()) for i in range(10))
+            )
+        finally:
+            pool.encerrar()
+        return resultados, len(gravacoes)
+
+    resultados, gravacoes = rodar(cenario())
+    assert all(resultados)
+    assert 1 <= gravacoes < 10
+    assert len(json.loads(arquivo.read_text(encoding='utf-8'))) == 10
+    assert not (tmp_path / 'd.json.tmp').exists()
+
+
+def test_recarregar_le_o_arquivo_e_refaz_o_indice(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    arquivo.write_text(json.dumps({'deus': entrada()}), encoding='utf-8')
+
+    async def cenario():
+        armazenamento = JsonArmazenamento(PoolDeTarefas(max_processos=1), str(arquivo))
+        await armazenamento.abrir()
+        arquivo.write_text(json.dumps({'Ódio': 'tristeza'}), encoding='utf-8')
+        ok = await armazenamento.recarregar()
+        return ok, armazenamento.termos(), armazenamento.resolver('odio'), armazenamento.termos_ordenados()
+
+    assert rodar(cenario()) == (True, ['ódio'], 'ódio', ['ódio'])
+
+
+def test_recarregar_nao_descarta_escrita_feita_durante_a_leitura(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    arquivo.write_text(json.dumps({'deus': entrada()}), encoding='utf-8')
+
+    async def cenario():
+        pool = PoolDeTarefas(max_processos=1)
+        armazenamento = JsonArmazenamento(pool, str(arquivo))
+        await armazenamento.abrir()
+
+        liberar = threading.Event()
+        carregar = armazenamento._carregar
+
+        def carregar_lento():
+            liberar.wait(5)
+            return carregar()
+
+        armazenamento._carregar = carregar_lento
+        try:
+            recarga = asyncio.create_task(armazenamento.recarregar())
+            await asyncio.sleep(0.01)
+            escrita = asyncio.create_task(armazenamento.salvar('novo', entrada()))
+            await asyncio.sleep(0.01)
+            liberar.set()
+            return await recarga, await escrita, armazenamento.resolver('novo')
+        finally:
+            pool.encerrar()
+
+    assert rodar(cenario()) == (False, True, 'novo')
+    assert 'novo' in json.loads(arquivo.read_text(encoding='utf-8'))
+
+
+def test_recarregar_arquivo_ilegivel_mantem_os_termos(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    arquivo.write_text(json.dumps({'deus': entrada()}), encoding='utf-8')
+
+    async def cenario():
+        armazenamento = JsonArmazenamento(PoolDeTarefas(max_processos=1), str(arquivo))
+        await armazenamento.abrir()
+        arquivo.write_text('{"deus": ', encoding='utf-8')
+        return await armazenamento.recarregar(), armazenamento.termos()
+
+    assert rodar(cenario()) == (False, ['deus'])
+
+
+def test_abrir_arquivo_ilegivel_guarda_copia(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    arquivo.write_text('{"deus": ', encoding='utf-8')
+
+    async def cenario():
+        armazenamento = JsonArmazenamento(PoolDeTarefas(max_processos=1), str(arquivo))
+        await armazenamento.abrir()
+        return len(armazenamento)
+
+    assert rodar(cenario()) == 0
+    copias = list(tmp_path.glob('d.json.corrompido-*'))
+    assert len(copias) == 1
+    assert copias[0].read_text(encoding='utf-8') == '{"deus": '
+
+
+def test_entrada_invalida_nao_descarta_o_arquivo(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    arquivo.write_text('{"Deus": "ok", "Modo": null}', encoding='utf-8')
+
+    async def cenario():
+        armazenamento = JsonArmazenamento(PoolDeTarefas(max_processos=1), str(arquivo))
+        await armazenamento.abrir()
+        return armazenamento.termos()
+
+    assert list(rodar(cenario())) == ['deus']
+    assert not list(tmp_path.glob('d.json.corrompido-*'))
+    assert (tmp_path / 'd.json.invalidos').exists()
+
+
+def test_gravacao_cancelada_continua_pendente(tmp_path, monkeypatch):
+    arquivo = tmp_path / 'd.json'
+
+    async def cenario():
+        pool = PoolDeTarefas(max_processos=1)
+        armazenamento = JsonArmazenamento(pool, str(arquivo))
+        await armazenamento.abrir()
+        gravar = armazenamento._gravar
+        iniciou = threading.Event()
+
+        def lento(conteudo):
+            iniciou.set()
+            time.sleep(0.2)
+
+        monkeypatch.setattr(armazenamento, '_gravar', lento)
+        tarefa = asyncio.create_task(armazenamento.salvar('deus', entrada()))
+        await asyncio.to_thread(iniciou.wait)
+        tarefa.cancel()
+        try:
+            await tarefa
+        except asyncio.CancelledError:
+            pass
+        assert armazenamento._pendente
+
+        # O fechamento regrava o que a gravação cancelada pode não ter escrito
+        monkeypatch.setattr(armazenamento, '_gravar', gravar)
+        await armazenamento.fechar()
+        pool.encerrar()
+
+    rodar(cenario())
+    assert list(json.loads(arquivo.read_text(encoding='utf-8'))) == ['deus']
+
+
+def test_escritas_usam_a_chave_exata():
+    async def cenario():
+        armazenamento = MemoriaArmazenamento(PoolDeTarefas(max_processos=1))
+        await armazenamento.abrir()
+        await armazenamento.salvar('avô', entrada('pai do pai'))
+        await armazenamento.salvar('País', entrada('nação'))
+
+        # Leitura aceita a variante sem acento...
+        assert armazenamento.resolver('pais') == 'país'
+        # ...mas "avó" e "pais" são outros termos para definir/editar/remover
+        assert armazenamento.obter('avó') is None
+        assert 'pais' not in armazenamento
+        await armazenamento.salvar('avó', entrada('mãe do pai'))
+        assert armazenamento.obter('avô')['definicao'] == 'pai do pai'
+        assert armazenamento.obter('AVÓ')['definicao'] == 'mãe do pai'
+
+        await armazenamento.salvar('pais', entrada('pai e mãe'))
+        await armazenamento.remover('pais')
+        return armazenamento.termos(), armazenamento.resolver('pais')
+
+    assert rodar(cenario()) == (['avô', 'país', 'avó'], 'país')
+
+
+def test_importar_nao_confunde_variantes():
+    async def cenario():
+        armazenamento = MemoriaArmazenamento(PoolDeTarefas(max_processos=1))
+        await armazenamento.abrir()
+        await armazenamento.salvar('odio', entrada())
+        resultado = await armazenamento.importar({'ódio': entrada(), 'odio': entrada()})
+        return resultado, sorted(armazenamento.termos())
+
+    assert rodar(cenario()) == ((1, 1), ['odio', 'ódio'])
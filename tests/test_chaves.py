@@ -0,0 +1,77 @@
+import unicodedata
+
+import pytest
+
+from nucleo.chaves import IndiceDobrado, canonizar, dobrar
+
+
+@pytest.mark.parametrize('termo', [
+    'ódio',
+    'Ódio',
+    'ÓDIO',
+    ' ódio ',
+    unicodedata.normalize('NFD', 'ódio'),
+    unicodedata.normalize('NFD', 'ÓDIO'),
+])
+def test_canonizar_variantes(termo):
+    assert canonizar(termo) == 'ódio'
+
+
+@pytest.mark.parametrize('termo, esperado', [
+    ('Deus', 'deus'),
+    ('ciência   intuitiva', 'ciência intuitiva'),
+    ('\tideia\nadequada ', 'ideia adequada'),
+    ('Ｄｅｕｓ', 'deus'),
+    ('ﬁlosofia', 'filosofia'),
+    ('Straße', 'strasse'),
+    ('ΐ', 'ΐ'),
+    ('İ', 'i̇'),
+    ('', ''),
+])
+def test_canonizar(termo, esperado):
+    assert canonizar(termo) == esperado
+
+
+def test_canonizar_e_idempotente():
+    for termo in ['Ódio', 'Straße', 'ΐ', 'İstanbul', 'ﬁlosofia  natural']:
+        assert canonizar(canonizar(termo)) == canonizar(termo)
+
+
+def test_dobrar():
+    assert dobrar('ódio') == 'odio'
+    assert dobrar('compaixão') == 'compaixao'
+    assert dobrar('ação') == 'acao'
+    assert dobrar('ódio', acentos=False) == 'ódio'
+
+
+def test_indice_busca_variantes():
+    indice = IndiceDobrado()
+    indice.reconstruir(['ódio', 'deus'])
+
+    assert indice.buscar('odio') == 'ódio'
+    assert indice.buscar('ódio') == 'ódio'
+    assert indice.buscar('deus') == 'deus'
+    assert indice.buscar('nada') is None
+
+
+def test_indice_varias_grafias_e_remocao():
+    indice = IndiceDobrado()
+    indice.adicionar('avô')
+    indice.adicionar('avó')
+
+    assert indice.buscar('avo') == min('avô', 'avó')
+
+    indice.remover('avó')
+    assert indice.buscar('avo') == 'avô'
+    indice.remover('avô')
+    assert indice.buscar('avo') is None
+    assert len(indice) == 0
+    indice.remover('inexistente')
+
+
+def test_indice_sem_dobrar_acentos():
+    indice = IndiceDobrado(acentos=False)
+    indice.reconstruir(['ódio'])
+
+    assert indice.buscar('ódio') == 'ódio'
+    assert indice.buscar('odio') is None
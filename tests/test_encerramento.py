@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+from nucleo.armazenamento import JsonArmazenamento
+from nucleo.encerramento import Encerramento
+from nucleo.esquema import nova_entrada
+from nucleo.tarefas import PoolDeTarefas
+
+
+def rodar(corrotina):
+    return asyncio.run(corrotina)
+
+
+def entrada(definicao='def'):
+    return nova_entrada(definicao, 'ana', 1, data='01/01/2024 00:00')
+
+
+def ler(arquivo):
+    return json.loads(arquivo.read_text(encoding='utf-8')) if arquivo.exists() else {}
+
+
+def test_encerrar_grava_pendente_antes_de_desconectar(tmp_path, monkeypatch):
+    arquivo = tmp_path / 'd.json'
+    eventos = []
+
+    async def cenario():
+        pool = PoolDeTarefas(max_processos=1)
+        armazenamento = JsonArmazenamento(pool, str(arquivo))
+        await armazenamento.abrir()
+
+        # A primeira gravação falha: a alteração fica só em memória
+        gravar = armazenamento._gravar
+        monkeypatch.setattr(armazenamento, '_gravar', lambda conteudo: 1 / 0)
+        assert not await armazenamento.salvar('deus', entrada())
+        monkeypatch.setattr(armazenamento, '_gravar', gravar)
+
+        async def desconectar():
+            eventos.append(('desconectar', ler(arquivo), pool._executor is None))
+
+        encerramento = Encerramento(armazenamento, pool, tempo=1)
+        assert await encerramento.encerrar(desconectar)
+        assert not await encerramento.encerrar(desconectar)
+
+    rodar(cenario())
+    assert eventos == [('desconectar', {'deus': entrada()}, True)]
+
+
+def test_encerrar_espera_comandos_em_andamento(tmp_path):
+    arquivo = tmp_path / 'd.json'
+
+    async def cenario():
+        pool = PoolDeTarefas(max_processos=1)
+        armazenamento = JsonArmazenamento(pool, str(arquivo))
+        await armazenamento.abrir()
+        encerramento = Encerramento(armazenamento, pool, tempo=5)
+        liberar = asyncio.Event()
+
+        async def comando():
+            async with encerramento.comando():
+                await liberar.wait()
+                await armazenamento.salvar('modo', entrada('afecção'))
+
+        tarefa = asyncio.create_task(comando())
+        await asyncio.sleep(0)
+        desconectado = []
+
+        async def desconectar():
+            desconectado.append(ler(arquivo))
+
+        encerrar = asyncio.create_task(encerramento.encerrar(desconectar))
+        await asyncio.sleep(0.05)
+        assert encerramento.encerrando
+        assert encerramento.em_andamento == 1
+        assert not desconectado
+
+        liberar.set()
+        await asyncio.gather(tarefa, encerrar)
+        return desconectado
+
+    assert rodar(cenario()) == [{'modo': entrada('afecção')}]
+
+
+def test_encerrar_nao_espera_alem_do_tempo(tmp_path):
+    async def cenario():
+        pool = PoolDeTarefas(max_processos=1)
+        armazenamento = JsonArmazenamento(pool, str(tmp_path / 'd.json'))
+        await armazenamento.abrir()
+        encerramento = Encerramento(armazenamento, pool, tempo=0.05)
+        desconectado = []
+
+        async def preso():
+            async with encerramento.comando():
+                await asyncio.sleep(10)
+
+        tarefa = asyncio.create_task(preso())
+        await asyncio.sleep(0)
+
+        async def desconectar():
+            desconectado.append(True)
+
+        await encerramento.encerrar(desconectar)
+        tarefa.cancel()
+        return desconectado, encerramento.em_andamento
+
+    assert rodar(cenario()) == ([True], 1)
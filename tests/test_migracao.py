@@ -0,0 +1,185 @@
+import json
+
+import pytest
+
+from nucleo.esquema import AUTOR_LEGADO
+from nucleo.migracao import iterar_pares, migrar_arquivo
+
+
+def escrever(caminho, dados):
+    caminho.write_text(json.dumps(dados, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+def entrada(definicao):
+    return {'definicao': definicao, 'autor': 'ana', 'autor_id': '1', 'data': '01/01/2024 00:00'}
+
+
+@pytest.mark.parametrize('texto, esperado', [
+    ('{}', []),
+    ('  {\n}  ', []),
+    ('{"a": 1}', [('a', 1)]),
+    ('{"a":1 , "b" : [1, {"x": "}"}]}', [('a', 1), ('b', [1, {'x': '}'}])]),
+    ('{"ódio": "tristeza", "\\u00e9": null}', [('ódio', 'tristeza'), ('é', None)]),
+])
+def test_iterar_pares(texto, esperado):
+    assert list(iterar_pares(texto)) == esperado
+
+
+@pytest.mark.parametrize('texto', [
+    '',
+    '[]',
+    '{"a": 1,}',
+    '{"a" 1}',
+    '{"a": 1} lixo',
+    '{"a": 1 "b": 2}',
+    '{1: 2}',
+    '{"a": 1',
+])
+def test_iterar_pares_invalido(texto):
+    with pytest.raises(ValueError):
+        list(iterar_pares(texto))
+
+
+def test_iterar_pares_igual_json_loads():
+    texto = json.dumps({f'termo {i}': {'n': i, 'l': [i] * 3} for i in range(50)}, indent=2)
+    assert dict(iterar_pares(texto)) == json.loads(texto)
+
+
+def test_migra_formato_antigo(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    escrever(arquivo, {'Deus': 'Substância infinita', 'modo': 'Afecção'})
+
+    entradas, migradas = migrar_arquivo(str(arquivo))
+
+    assert migradas == 2
+    assert list(entradas) == ['deus', 'modo']
+    assert entradas['deus']['definicao'] == 'Substância infinita'
+    assert entradas['deus']['autor'] == AUTOR_LEGADO
+    gravado = arquivo.read_text(encoding='utf-8')
+    assert gravado == json.dumps(entradas, ensure_ascii=False, indent=2)
+    assert not (tmp_path / 'd.json.tmp').exists()
+
+
+def test_arquivo_atual_nao_e_reescrito(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    escrever(arquivo, {'deus': entrada('x')})
+    antes = arquivo.stat().st_mtime_ns
+    texto = arquivo.read_text(encoding='utf-8')
+
+    entradas, migradas = migrar_arquivo(str(arquivo))
+
+    assert migradas == 0
+    assert entradas == {'deus': entrada('x')}
+    assert arquivo.stat().st_mtime_ns == antes
+    assert arquivo.read_text(encoding='utf-8') == texto
+    assert list(tmp_path.iterdir()) == [arquivo]
+
+
+def test_migra_para_outro_destino(tmp_path):
+    origem = tmp_path / 'antigo.json'
+    destino = tmp_path / 'novo.json'
+    escrever(origem, {'deus': entrada('x')})
+
+    entradas, migradas = migrar_arquivo(str(origem), str(destino))
+
+    assert migradas == 0
+    assert json.loads(destino.read_text(encoding='utf-8')) == entradas
+
+
+def test_arquivo_invalido_nao_e_alterado(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    arquivo.write_text('{"Deus": "x",', encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        migrar_arquivo(str(arquivo))
+
+    assert arquivo.read_text(encoding='utf-8') == '{"Deus": "x",'
+    assert list(tmp_path.iterdir()) == [arquivo]
+
+
+def test_colisao_guarda_entrada_deslocada(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    escrever(arquivo, {'Deus': 'da Ética', 'deus': 'do usuário', 'modo': 'afecção'})
+
+    entradas, migradas = migrar_arquivo(str(arquivo))
+
+    # Fica a grafia já canônica, que era a encontrada pelo !buscar antigo
+    assert entradas['deus']['definicao'] == 'do usuário'
+    assert list(entradas) == ['deus', 'modo']
+    colisoes = json.loads((tmp_path / 'd.json.colisoes').read_text(encoding='utf-8'))
+    assert [(c['termo'], c['chave'], c['entrada']['definicao']) for c in colisoes] == [
+        ('Deus', 'deus', 'da Ética')
+    ]
+    assert json.loads(arquivo.read_text(encoding='utf-8')) == entradas
+    assert migradas == 3
+
+
+def test_colisao_sem_grafia_canonica_mantem_a_primeira(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    escrever(arquivo, {'Ódio': 'primeiro', 'ÓDIO': 'segundo'})
+
+    entradas, _ = migrar_arquivo(str(arquivo))
+
+    assert entradas == {'ódio': entradas['ódio']}
+    assert entradas['ódio']['definicao'] == 'primeiro'
+    colisoes = json.loads((tmp_path / 'd.json.colisoes').read_text(encoding='utf-8'))
+    assert [c['termo'] for c in colisoes] == ['ÓDIO']
+
+
+def test_colisoes_anteriores_nao_sao_sobrescritas(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    (tmp_path / 'd.json.colisoes').write_text('conteúdo antigo', encoding='utf-8')
+    escrever(arquivo, {'Deus': 'a', 'deus': 'b'})
+
+    migrar_arquivo(str(arquivo))
+
+    assert (tmp_path / 'd.json.colisoes').read_text(encoding='utf-8') == 'conteúdo antigo'
+    colisoes = json.loads((tmp_path / 'd.json.colisoes-2').read_text(encoding='utf-8'))
+    assert [c['termo'] for c in colisoes] == ['Deus']
+
+
+def test_falha_ao_gravar_colisoes_preserva_o_original(tmp_path, monkeypatch):
+    arquivo = tmp_path / 'd.json'
+    escrever(arquivo, {'Deus': 'a', 'deus': 'b'})
+    original = arquivo.read_text(encoding='utf-8')
+
+    def falhar(destino, sufixo, itens):
+        raise OSError('disco cheio')
+
+    monkeypatch.setattr('nucleo.migracao._gravar_separados', falhar)
+    with pytest.raises(OSError):
+        migrar_arquivo(str(arquivo))
+
+    assert arquivo.read_text(encoding='utf-8') == original
+    assert list(tmp_path.iterdir()) == [arquivo]
+
+
+def test_grafia_canonica_depois_desloca_a_anterior(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    escrever(arquivo, {'DEUS': 'a', 'modo': entrada('b'), 'Deus': 'c', 'deus': 'd'})
+
+    entradas, migradas = migrar_arquivo(str(arquivo))
+
+    assert list(entradas) == ['deus', 'modo']
+    assert entradas['deus']['definicao'] == 'd'
+    colisoes = json.loads((tmp_path / 'd.json.colisoes').read_text(encoding='utf-8'))
+    assert [c['termo'] for c in colisoes] == ['Deus', 'DEUS']
+    assert migradas == 3
+
+
+def test_entradas_invalidas_sao_guardadas_a_parte(tmp_path):
+    arquivo = tmp_path / 'd.json'
+    escrever(arquivo, {'Deus': 'ok', 'Modo': None, 'Atributo': [1], '  ': 'vazio', 'ética': entrada('x')})
+
+    entradas, migradas = migrar_arquivo(str(arquivo))
+
+    assert list(entradas) == ['deus', 'ética']
+    assert migradas == 4
+    invalidos = json.loads((tmp_path / 'd.json.invalidos').read_text(encoding='utf-8'))
+    assert invalidos == [
+        {'termo': 'Modo', 'valor': None},
+        {'termo': 'Atributo', 'valor': [1]},
+        {'termo': '  ', 'valor': 'vazio'},
+    ]
+    assert json.loads(arquivo.read_text(encoding='utf-8')) == entradas
+    assert not (tmp_path / 'd.json.colisoes').exists()
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from nucleo.tarefas import (
+    PoolDeTarefas, PoolOcupado, dividir_em_lotes, preparar_importacao, serializar_dicionario
+)
+
+
+def rodar(corrotina):
+    return asyncio.run(corrotina)
+
+
+def test_dividir_em_lotes():
+    assert dividir_em_lotes(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+    assert dividir_em_lotes([], 2) == []
+
+
+def test_preparar_importacao_canoniza_termos():
+    entradas = preparar_importacao([('Ódio ', 'tristeza')], 'Espinosa', 'sistema', '01/01/2024 00:00')
+    assert entradas == {'ódio': {
+        'definicao': 'tristeza', 'autor': 'Espinosa', 'autor_id': 'sistema', 'data': '01/01/2024 00:00'
+    }}
+
+
+def test_serializar_dicionario():
+    dicionario = {'ódio': {'definicao': 'tristeza'}}
+    conteudo = serializar_dicionario(dicionario)
+    assert 'ódio' in conteudo
+    assert json.loads(conteudo) == dicionario
+
+
+def test_executar_devolve_o_resultado():
+    async def cenario():
+        pool = PoolDeTarefas()
+        try:
+            return await pool.executar(sorted, [3, 1, 2]), pool.pendentes
+        finally:
+            pool.encerrar()
+
+    assert rodar(cenario()) == ([1, 2, 3], 0)
+
+
+def test_fila_cheia_levanta_pool_ocupado():
+    async def cenario():
+        pool = PoolDeTarefas(max_pendentes=1)
+        try:
+            lenta = asyncio.create_task(pool.executar(time.sleep, 0.3))
+            await asyncio.sleep(0)
+            with pytest.raises(PoolOcupado):
+                await pool.executar(sorted, [1])
+            with pytest.raises(PoolOcupado):
+                await pool.executar_em_lotes(sorted, [[1]])
+            # Gravações obrigatórias ignoram o limite
+            resultado = await pool.executar(sorted, [2, 1], limitar=False)
+            await lenta
+            return resultado, pool.pendentes
+        finally:
+            pool.encerrar()
+
+    assert rodar(cenario()) == ([1, 2], 0)
+
+
+def test_executar_em_lotes_mantem_a_ordem_e_informa_progresso():
+    progresso = []
+
+    async def registrar(concluidos, total):
+        progresso.append((concluidos, total))
+
+    async def cenario():
+        pool = PoolDeTarefas(max_processos=2)
+        try:
+            return await pool.executar_em_lotes(sum, list(range(10)), tamanho_lote=3, progresso=registrar)
+        finally:
+            pool.encerrar()
+
+    assert rodar(cenario()) == [0 + 1 + 2, 3 + 4 + 5, 6 + 7 + 8, 9]
+    assert progresso == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+def test_cancelamento_libera_a_vaga_na_fila():
+    async def cenario():
+        pool = PoolDeTarefas(max_pendentes=2)
+        try:
+            ocupando = asyncio.create_task(pool.executar(time.sleep, 0.3))
+            esperando = asyncio.create_task(pool.executar_em_lotes(sorted, [[2, 1]] * 3, tamanho_lote=1))
+            await asyncio.sleep(0.05)
+            assert pool.pendentes == 2
+
+            esperando.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await esperando
+            assert pool.pendentes == 1
+
+            await ocupando
+            return pool.pendentes, await pool.executar(sorted, [2, 1])
+        finally:
+            pool.encerrar()
+
+    assert rodar(cenario()) == (0, [1, 2])
+
+
+def test_erro_em_um_lote_propaga_a_excecao_original():
+    async def cenario():
+        pool = PoolDeTarefas()
+        try:
+            # sorted de uma lista com tipos misturados levanta TypeError no processo
+            await pool.executar_em_lotes(sorted, [2, 1, 'a', 1], tamanho_lote=2)
+        finally:
+            pool.encerrar()
+
+    with pytest.raises(TypeError):
+        rodar(cenario())